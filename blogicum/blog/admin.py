@@ -1,13 +1,32 @@
 from django.contrib import admin
+from django.forms.models import BaseInlineFormSet
 
 from blog.models import Category, Location, Post, Comment
 
 admin.site.empty_value_display = 'Не задано'
 
 
+class PostInlineFormSet(BaseInlineFormSet):
+
+    def get_queryset(self):
+        if not hasattr(self, '_queryset'):
+            self._queryset = super().get_queryset()[:self.max_num]
+        return self._queryset
+
+
 class PostInline(admin.TabularInline):
     model = Post
+    formset = PostInlineFormSet
+    fields = ('title', 'is_published', 'pub_date')
     extra = 0
+    max_num = 20
+    show_change_link = True
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).only(
+            'id', 'title', 'is_published', 'pub_date', 'updated_at',
+            'category'
+        )
 
 
 class CategoryAdmin(admin.ModelAdmin):
@@ -46,6 +65,8 @@ class PostAdmin(admin.ModelAdmin):
     search_fields = ('title',)
     list_filter = ('is_published',)
     list_display_links = ('title',)
+    list_select_related = ('category', 'location', 'author')
+    raw_id_fields = ('author', 'category', 'location')
 
 
 admin.site.register(Post, PostAdmin)
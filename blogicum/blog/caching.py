@@ -0,0 +1,35 @@
+from functools import wraps
+
+from django.core.cache import cache
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
+
+from blogicum import constants
+
+
+def get_cache_version():
+    return cache.get_or_set(constants.CACHE_VERSION_KEY, 1, None)
+
+
+def bump_cache_version():
+    try:
+        cache.incr(constants.CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(constants.CACHE_VERSION_KEY, 1, None)
+
+
+def versioned_cache_page(timeout):
+    """Like ``cache_page``, but the key prefix carries the blog cache
+    version, so every cached page is dropped by ``bump_cache_version``."""
+
+    def decorator(view_func):
+        view_func = vary_on_cookie(view_func)
+
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            key_prefix = f'blog:{get_cache_version()}'
+            return cache_page(timeout, key_prefix=key_prefix)(view_func)(
+                request, *args, **kwargs
+            )
+        return _wrapped_view
+    return decorator
@@ -0,0 +1,32 @@
+# Generated by Django 3.2.16 on 2026-10-15 17:08
+
+from django.db import migrations, models
+import django.db.models.functions
+
+
+def fill_comment_count(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    Comment = apps.get_model('blog', 'Comment')
+    comment_count = models.Subquery(
+        Comment.objects.filter(post_id=models.OuterRef('pk')).order_by(
+        ).values('post_id').annotate(c=models.Count('*')).values('c')[:1],
+        output_field=models.IntegerField(),
+    )
+    Post.objects.update(
+        comment_count=models.functions.Coalesce(comment_count, 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_auto_20230613_2028'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comment_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False, verbose_name='Количество комментариев'),
+        ),
+        migrations.RunPython(fill_comment_count, migrations.RunPython.noop),
+    ]
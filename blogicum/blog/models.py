@@ -1,10 +1,18 @@
 from django.contrib.auth import get_user_model
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
 from django.conf import settings
 
 User = get_user_model()
 
+POST_CARD_FIELDS = (
+    'id', 'title', 'text', 'pub_date', 'image', 'is_published',
+    'updated_at', 'comment_count', 'author__username', 'category__slug',
+    'category__title', 'category__is_published', 'location__name',
+    'location__is_published',
+)
+
 
 class IsPublishedModel(models.Model):
     is_published = models.BooleanField(
@@ -47,6 +55,22 @@ class Location(IsPublishedModel):
         return self.name
 
 
+class PostQuerySet(models.QuerySet):
+
+    def published(self):
+        return self.filter(
+            is_published=True,
+            category__is_published=True,
+            pub_date__lte=timezone.now(),
+        )
+
+    def with_related(self):
+        return self.select_related('category', 'author', 'location')
+
+    def for_card(self):
+        return self.with_related().only(*POST_CARD_FIELDS)
+
+
 class Post(IsPublishedModel):
     title = models.CharField('Заголовок', max_length=256)
     text = models.TextField('Текст')
@@ -80,11 +104,44 @@ class Post(IsPublishedModel):
         upload_to=settings.POST_IMAGE_DIR,
         blank=True,
     )
+    updated_at = models.DateTimeField('Изменено', auto_now=True)
+    comment_count = models.PositiveIntegerField(
+        'Количество комментариев',
+        default=0,
+        db_index=True,
+        editable=False,
+    )
+
+    objects = PostQuerySet.as_manager()
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('-pub_date', )
+        indexes = (
+            models.Index(
+                fields=('-pub_date',),
+                condition=models.Q(is_published=True),
+                name='post_published_pub_date_idx',
+            ),
+            models.Index(
+                fields=('category', '-pub_date'),
+                name='post_category_pub_date_idx',
+            ),
+            models.Index(
+                fields=('author', '-pub_date'),
+                name='post_author_pub_date_idx',
+            ),
+        )
+
+    def save(self, *args, **kwargs):
+        # Partial saves (update_fields, instances loaded with only()) must
+        # still refresh updated_at: the post card cache key depends on it.
+        self.updated_at = timezone.now()
+        update_fields = kwargs.get('update_fields')
+        if update_fields:
+            kwargs['update_fields'] = {*update_fields, 'updated_at'}
+        super().save(*args, **kwargs)
 
     def get_absolute_url(self):
         return reverse("blog:post_detail", args=[self.pk])
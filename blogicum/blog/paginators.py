@@ -0,0 +1,43 @@
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+from blogicum import constants
+
+
+class PKWindowPaginator(Paginator):
+    """Paginator that slices primary keys first and loads the full rows
+    of the requested page only."""
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        page_pks = list(
+            self.object_list.values_list('pk', flat=True)[bottom:top]
+        )
+        return self._get_page(
+            self.object_list.filter(pk__in=page_pks), number, self
+        )
+
+
+class CachedCountPaginator(PKWindowPaginator):
+    """Paginator that keeps the total number of objects in the cache.
+
+    Meant for a single listing (the index page): every instance shares
+    ``POSTS_COUNT_CACHE_KEY``.
+    """
+
+    @cached_property
+    def count(self):
+        count = cache.get(constants.POSTS_COUNT_CACHE_KEY)
+        if count is None:
+            count = super().count
+            cache.set(
+                constants.POSTS_COUNT_CACHE_KEY,
+                count,
+                constants.POSTS_COUNT_CACHE_TIMEOUT,
+            )
+        return count
@@ -0,0 +1,112 @@
+from threading import local
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import (post_delete, post_save, pre_delete,
+                                      pre_save)
+from django.dispatch import receiver
+
+from blog.caching import bump_cache_version
+from blog.models import Category, Comment, Location, Post
+from blogicum import constants
+
+User = get_user_model()
+
+_deleting = local()
+
+
+def _deleting_post_ids():
+    if not hasattr(_deleting, 'post_ids'):
+        _deleting.post_ids = set()
+    return _deleting.post_ids
+
+
+@receiver(pre_delete, sender=Post)
+def mark_post_deleting(sender, instance, **kwargs):
+    _deleting_post_ids().add(instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+def unmark_post_deleting(sender, instance, **kwargs):
+    _deleting_post_ids().discard(instance.pk)
+
+
+@receiver(post_save, sender=Comment)
+def increment_comment_count(sender, instance, created, raw, **kwargs):
+    if created and not raw:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, **kwargs):
+    # Comments removed together with their post need neither the counter
+    # update nor a cache version bump: the post's own signals cover it.
+    if instance.post_id in _deleting_post_ids():
+        return
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1
+    )
+    bump_cache_version()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_page_cache(sender, **kwargs):
+    bump_cache_version()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_page_cache_for_user(sender, update_fields=None, **kwargs):
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    bump_cache_version()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_posts_count_cache(sender, **kwargs):
+    cache.delete(constants.POSTS_COUNT_CACHE_KEY)
+
+
+@receiver(pre_save, sender=Category)
+def invalidate_old_category_cache(sender, instance, **kwargs):
+    if instance.pk is None:
+        return
+    old_slug = Category.objects.filter(pk=instance.pk).values_list(
+        'slug', flat=True).first()
+    if old_slug is not None and old_slug != instance.slug:
+        cache.delete(constants.CATEGORY_CACHE_KEY.format(old_slug))
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_cache(sender, instance, **kwargs):
+    cache.delete(constants.CATEGORY_CACHE_KEY.format(instance.slug))
+
+
+@receiver(pre_save, sender=User)
+def invalidate_old_profile_cache(sender, instance, update_fields, **kwargs):
+    if instance.pk is None or (
+            update_fields is not None and 'username' not in update_fields):
+        return
+    old_username = User.objects.filter(pk=instance.pk).values_list(
+        'username', flat=True).first()
+    if old_username is not None and old_username != instance.username:
+        cache.delete(constants.PROFILE_CACHE_KEY.format(old_username))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_profile_cache(sender, instance, **kwargs):
+    cache.delete(constants.PROFILE_CACHE_KEY.format(instance.username))
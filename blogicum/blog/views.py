@@ -1,11 +1,11 @@
-import datetime as dt
 from typing import Any
 
-from django.core.paginator import Paginator
-from django.db.models import Count
+from django.core.cache import cache
+from django.db.models import Prefetch
 from django.db.models.query import QuerySet
 from django.contrib.auth.decorators import login_required
 from django.urls import reverse_lazy
+from django.utils.decorators import method_decorator
 from django.shortcuts import (get_object_or_404,
                               render, redirect)
 from django.contrib.auth import get_user_model
@@ -13,14 +13,44 @@ from django.views.generic import (CreateView, DeleteView, UpdateView,
                                   DetailView, ListView)
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied
-from django.views.generic.edit import DeletionMixin
+from django.http import Http404
 
 from blogicum import constants
+from blog.caching import versioned_cache_page
 from blog.models import Post, Category, Comment
+from blog.paginators import CachedCountPaginator, PKWindowPaginator
 from blog.forms import PostForm, CommentForm, UserForm
 
 User = get_user_model()
 
+PROFILE_FIELDS = (
+    'id', 'username', 'first_name', 'last_name', 'is_staff', 'date_joined',
+)
+
+
+def get_cached_object_or_404(key, klass, **kwargs):
+    instance = cache.get(key)
+    if instance is None:
+        instance = get_object_or_404(klass, **kwargs)
+        cache.set(key, instance, constants.CACHE_TIMEOUT)
+    return instance
+
+
+class CachedObjectMixin:
+
+    def get_object(self, queryset=None):
+        if not hasattr(self, '_object'):
+            self._object = super().get_object(queryset)
+        return self._object
+
+
+class AuthorRequiredMixin:
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.get_object().author != request.user:
+            return redirect('blog:post_detail', pk=kwargs['pk'])
+        return super().dispatch(request, *args, **kwargs)
+
 
 class PostAuthorMixin:
     model = Post
@@ -31,7 +61,7 @@ class PostAuthorMixin:
         return super().form_valid(form)
 
 
-class CommentMixin:
+class CommentMixin(CachedObjectMixin):
     model = Comment
     template_name = 'blog/comment.html'
 
@@ -47,15 +77,15 @@ class CommentMixin:
         )
 
 
-class UserUpdateView(LoginRequiredMixin, UpdateView):
+class UserUpdateView(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = User
     form_class = UserForm
     template_name = 'blog/user.html'
-
-    def get_object(self):
-        return get_object_or_404(User, username=self.kwargs['slug'],)
+    slug_field = 'username'
 
     def dispatch(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
         instance = self.get_object()
         if instance != request.user:
             raise PermissionDenied
@@ -75,47 +105,45 @@ class CommentDeleteView(CommentMixin, LoginRequiredMixin, DeleteView):
     pass
 
 
+@method_decorator(
+    versioned_cache_page(constants.PAGE_CACHE_TIMEOUT), name='dispatch'
+)
 class PostListView(ListView):
     model = Post
     paginate_by = constants.POSTS_PER_PAGE
+    paginator_class = CachedCountPaginator
     template_name = 'blog/index.html'
     ordering = '-pub_date'
 
     def get_queryset(self) -> QuerySet[Any]:
-        return (super().get_queryset().annotate(
-            comment_count=Count('comments')
-        ).select_related(
-            'category', 'author', 'location'
-        ).filter(
-            is_published=True,
-            category__is_published=True,
-            pub_date__lte=dt.datetime.now(dt.timezone.utc),
-        )
-        )
+        return super().get_queryset().published().for_card()
 
 
 class PostDetailView(DetailView):
     model = Post
     template_name = 'blog/detail.html'
 
+    def get_queryset(self) -> QuerySet[Any]:
+        return super().get_queryset().with_related().prefetch_related(
+            Prefetch(
+                'comments',
+                queryset=Comment.objects.select_related('author'),
+            )
+        )
+
     def get_context_data(self, **kwargs):
         context = dict(
             **super().get_context_data(**kwargs),
             form=CommentForm(),
-            comments=self.object.comments.select_related('author'),
+            comments=self.object.comments.all(),
         )
         return context
 
 
-class PostUpdateView(PostAuthorMixin, UpdateView, LoginRequiredMixin):
+class PostUpdateView(PostAuthorMixin, AuthorRequiredMixin, CachedObjectMixin,
+                     UpdateView, LoginRequiredMixin):
     template_name = 'blog/create.html'
 
-    def dispatch(self, request, *args, **kwargs):
-        instance = self.get_object()
-        if instance.author != request.user:
-            return redirect('blog:post_detail', pk=kwargs['pk'])
-        return super().dispatch(request, *args, **kwargs)
-
 
 class PostCreateView(PostAuthorMixin, LoginRequiredMixin, CreateView):
     template_name = 'blog/create.html'
@@ -127,20 +155,30 @@ class PostCreateView(PostAuthorMixin, LoginRequiredMixin, CreateView):
         )
 
 
-class PostDeleteView(DeletionMixin, PostUpdateView):
+class PostDeleteView(LoginRequiredMixin, AuthorRequiredMixin,
+                     CachedObjectMixin, DeleteView):
+    model = Post
+    template_name = 'blog/create.html'
     success_url = reverse_lazy('blog:index')
 
 
+@method_decorator(
+    versioned_cache_page(constants.PAGE_CACHE_TIMEOUT), name='dispatch'
+)
 class CategoryListView(ListView):
     model = Post
     template_name = 'blog/category.html'
     paginate_by = constants.POSTS_PER_PAGE
+    paginator_class = PKWindowPaginator
     ordering = '-pub_date'
 
     def get_context_data(self, **kwargs):
         context = dict(
             **super().get_context_data(**kwargs),
-            category=get_object_or_404(
+            category=get_cached_object_or_404(
+                constants.CATEGORY_CACHE_KEY.format(
+                    self.kwargs['category_slug']
+                ),
                 Category,
                 slug=self.kwargs['category_slug'],
                 is_published=True,
@@ -149,25 +187,22 @@ class CategoryListView(ListView):
         return context
 
     def get_queryset(self) -> QuerySet[Any]:
-        return (super().get_queryset().annotate(
-            comment_count=Count('comments')
-        ).select_related(
-            'category', 'author', 'location'
-        ).filter(
-            is_published=True,
-            category__is_published=True,
-            pub_date__lte=dt.datetime.now(dt.timezone.utc),
+        return super().get_queryset().published().for_card().filter(
             category__slug=self.kwargs['category_slug']
         )
-        )
 
 
+@versioned_cache_page(constants.PAGE_CACHE_TIMEOUT)
 def profile(request, slug):
-    profile = get_object_or_404(User, username=slug)
-    posts = Post.objects.annotate(comment_count=Count(
-        'comments')).select_related('category', 'author', 'location').filter(
-        author=profile).order_by('-pub_date')
-    paginator = Paginator(posts, constants.POSTS_PER_PAGE)
+    profile = get_cached_object_or_404(
+        constants.PROFILE_CACHE_KEY.format(slug),
+        User.objects.only(*PROFILE_FIELDS),
+        username=slug,
+    )
+    posts = Post.objects.for_card().filter(
+        author=profile
+    ).order_by('-pub_date')
+    paginator = PKWindowPaginator(posts, constants.POSTS_PER_PAGE)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     context = {
@@ -179,11 +214,12 @@ def profile(request, slug):
 
 @login_required
 def add_comment(request, pk):
-    post = get_object_or_404(Post, pk=pk)
+    if not Post.objects.filter(pk=pk).exists():
+        raise Http404
     form = CommentForm(request.POST)
     if form.is_valid():
         comment = form.save(commit=False)
         comment.author = request.user
-        comment.post = post
+        comment.post_id = pk
         comment.save()
     return redirect('blog:post_detail', pk=pk)
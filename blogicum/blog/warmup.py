@@ -0,0 +1,21 @@
+from django.urls import get_resolver, reverse
+
+WARM_UP_URLS = (
+    ('blog:index', {}),
+    ('blog:post_detail', {'pk': 1}),
+    ('blog:category_posts', {'category_slug': 'slug'}),
+    ('blog:profile', {'slug': 'slug'}),
+)
+
+
+def warm_up_urls():
+    """Build the URL resolver caches before the first request.
+
+    Has to run after all apps are ready: the root URLconf reads
+    ``admin.site.urls``, which is only complete after admin autodiscovery.
+    """
+    resolver = get_resolver()
+    resolver.url_patterns
+    resolver.reverse_dict
+    for name, kwargs in WARM_UP_URLS:
+        reverse(name, kwargs=kwargs)
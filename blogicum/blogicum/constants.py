@@ -1 +1,8 @@
 POSTS_PER_PAGE = 10
+CACHE_TIMEOUT = 300
+CATEGORY_CACHE_KEY = 'category:{}'
+PROFILE_CACHE_KEY = 'profile:{}'
+PAGE_CACHE_TIMEOUT = 60
+CACHE_VERSION_KEY = 'blog:version'
+POSTS_COUNT_CACHE_KEY = 'blog:posts:count'
+POSTS_COUNT_CACHE_TIMEOUT = 60
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -35,6 +36,12 @@ MIDDLEWARE = [
     'debug_toolbar.middleware.DebugToolbarMiddleware',
 ]
 
+SILK_ENABLED = os.getenv('SILK_ENABLED', 'False') == 'True'
+
+if SILK_ENABLED:
+    INSTALLED_APPS += ['silk']
+    MIDDLEWARE.insert(0, 'silk.middleware.SilkyMiddleware')
+
 INTERNAL_IPS = [
     '127.0.0.1'
 ]
@@ -59,6 +66,15 @@ TEMPLATES = [
     },
 ]
 
+# LocMemCache is per process: signal-driven invalidation only reaches the
+# worker that handled the write. Multi-process deployments need a shared
+# backend (Memcached, Redis) here.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
 WSGI_APPLICATION = 'blogicum.wsgi.application'
 
 DATABASES = {
@@ -26,3 +26,6 @@ urlpatterns = [
 if settings.DEBUG:
     import debug_toolbar
     urlpatterns += (path('__debug__/', include(debug_toolbar.urls)),)
+
+if settings.SILK_ENABLED:
+    urlpatterns += (path('silk/', include('silk.urls', namespace='silk')),)
@@ -0,0 +1,119 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from bs4 import BeautifulSoup
+from django.core.cache import cache
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+from blogicum import constants
+
+
+@pytest.mark.django_db
+def test_profile_cache_drops_old_username(client, user):
+    old_username = user.username
+    old_key = constants.PROFILE_CACHE_KEY.format(old_username)
+    response = client.get(f'/profile/{old_username}/')
+    assert response.status_code == HTTPStatus.OK
+    cached_profile = cache.get(old_key)
+    assert cached_profile is not None
+    assert 'password' not in cached_profile.__dict__, (
+        'Убедитесь, что в кеше профиля не хранится хеш пароля.'
+    )
+    user.username = f'{old_username}_renamed'
+    user.save()
+    assert cache.get(old_key) is None, (
+        'Убедитесь, что при смене имени пользователя из кеша удаляется '
+        'запись для старого имени.'
+    )
+
+
+@pytest.mark.django_db
+def test_category_cache_drops_old_slug(client, mixer: Mixer):
+    category = mixer.blend('blog.Category', is_published=True)
+    old_key = constants.CATEGORY_CACHE_KEY.format(category.slug)
+    response = client.get(f'/category/{category.slug}/')
+    assert response.status_code == HTTPStatus.OK
+    assert cache.get(old_key) is not None
+    category.slug = f'{category.slug}-renamed'
+    category.save()
+    assert cache.get(old_key) is None, (
+        'Убедитесь, что при смене слага категории из кеша удаляется '
+        'запись для старого слага.'
+    )
+
+
+@pytest.mark.django_db
+def test_profile_page_follows_rename(client, user):
+    old_username = user.username
+    response = client.get(f'/profile/{old_username}/')
+    assert response.status_code == HTTPStatus.OK
+    user.username = f'{old_username}_renamed'
+    user.save()
+    response = client.get(f'/profile/{old_username}/')
+    assert response.status_code == HTTPStatus.NOT_FOUND, (
+        'Убедитесь, что после смены имени пользователя страница профиля '
+        'по старому имени не отдаётся из кеша.'
+    )
+    response = client.get(f'/profile/{user.username}/')
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+def test_post_card_follows_category_changes(
+        client, user, mixer: Mixer, published_category):
+    mixer.blend('blog.Post', author=user, category=published_category)
+    old_title = published_category.title
+    response = client.get(f'/profile/{user.username}/')
+    assert old_title in response.content.decode('utf-8')
+    published_category.title = f'{old_title} renamed'
+    published_category.is_published = False
+    published_category.save()
+    content = client.get(f'/profile/{user.username}/').content.decode('utf-8')
+    assert published_category.title in content, (
+        'Убедитесь, что карточка публикации обновляется '
+        'после изменения категории.'
+    )
+    assert 'Выбранная категория снята с публикации админом' in content, (
+        'Убедитесь, что карточка публикации показывает, что категория '
+        'снята с публикации.'
+    )
+
+
+@pytest.mark.django_db
+def test_post_card_follows_category_inline_edit(
+        admin_client, user, mixer: Mixer, published_category,
+        published_location):
+    post = mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        location=published_location,
+        pub_date=timezone.now() - timedelta(days=1))
+    assert post.title in client_get_content(admin_client, '/')
+    change_url = f'/admin/blog/category/{published_category.pk}/change/'
+    form = BeautifulSoup(
+        client_get_content(admin_client, change_url), 'html.parser'
+    ).find('form', id='category_form')
+    data = {}
+    for field in form.find_all(['input', 'textarea']):
+        name = field.get('name')
+        if not name or (
+                field.get('type') == 'checkbox'
+                and not field.has_attr('checked')):
+            continue
+        data[name] = (
+            field.text if field.name == 'textarea'
+            else field.get('value', 'on'))
+    data['post-0-title'] = f'{post.title} renamed'
+    response = admin_client.post(change_url, data)
+    assert response.status_code == HTTPStatus.FOUND
+    assert f'{post.title} renamed' in client_get_content(admin_client, '/'), (
+        'Убедитесь, что карточка публикации обновляется после '
+        'редактирования публикации во встроенной форме категории.'
+    )
+
+
+def client_get_content(client, url):
+    response = client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    return response.content.decode('utf-8')
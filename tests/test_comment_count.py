@@ -0,0 +1,55 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from mixer.backend.django import Mixer
+
+N_COMMENTS = 5
+
+
+@pytest.mark.django_db
+def test_comment_count_follows_comments(mixer: Mixer, user):
+    post = mixer.blend('blog.Post', author=user)
+    comment = mixer.blend('blog.Comment', post=post, author=user)
+    post.refresh_from_db()
+    assert post.comment_count == 1, (
+        'Убедитесь, что создание комментария увеличивает '
+        '`Post.comment_count` на единицу.'
+    )
+    comment.delete()
+    post.refresh_from_db()
+    assert post.comment_count == 0, (
+        'Убедитесь, что удаление комментария уменьшает '
+        '`Post.comment_count` на единицу.'
+    )
+
+
+@pytest.mark.django_db
+def test_post_delete_skips_comment_count_updates(mixer: Mixer, user):
+    post = mixer.blend('blog.Post', author=user)
+    mixer.cycle(N_COMMENTS).blend('blog.Comment', post=post, author=user)
+    with CaptureQueriesContext(connection) as queries:
+        post.delete()
+    post_updates = [
+        query for query in queries.captured_queries
+        if query['sql'].startswith('UPDATE "blog_post"')
+    ]
+    assert not post_updates, (
+        'Убедитесь, что при удалении публикации каскадное удаление '
+        'комментариев не обновляет `Post.comment_count`.'
+    )
+
+
+@pytest.mark.django_db
+def test_comment_count_survives_dump_and_load(
+        mixer: Mixer, user, PostModel, tmp_path):
+    post = mixer.blend('blog.Post', author=user)
+    mixer.cycle(2).blend('blog.Comment', post=post, author=user)
+    dump = tmp_path / 'blog.json'
+    call_command('dumpdata', 'blog', output=str(dump), verbosity=0)
+    PostModel.objects.filter(pk=post.pk).delete()
+    call_command('loaddata', str(dump), verbosity=0)
+    post.refresh_from_db()
+    assert post.comment_count == 2, (
+        'Убедитесь, что загрузка фикстур не меняет `Post.comment_count`.'
+    )
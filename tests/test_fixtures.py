@@ -0,0 +1,16 @@
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+def test_db_json_loads(PostModel):
+    try:
+        call_command('loaddata', settings.BASE_DIR / 'db.json', verbosity=0)
+    except Exception as e:
+        raise AssertionError(
+            'Убедитесь, что фикстура `db.json` загружается командой '
+            '`loaddata`. При загрузке возникла ошибка:\n'
+            f'{type(e).__name__}: {e}'
+        )
+    assert PostModel.objects.exists()
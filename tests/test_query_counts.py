@@ -0,0 +1,69 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+N_POSTS = 50
+N_COMMENTS = 200
+MAX_LIST_QUERIES = 4
+MAX_DETAIL_QUERIES = 2
+
+
+@pytest.fixture
+def posts_with_comments(mixer: Mixer, user, published_category,
+                        published_location):
+    posts = mixer.cycle(N_POSTS).blend(
+        'blog.Post', author=user, category=published_category,
+        location=published_location, is_published=True,
+        pub_date=timezone.now() - timedelta(days=1))
+    mixer.cycle(N_COMMENTS).blend(
+        'blog.Comment', author=user, post=mixer.sequence(*posts))
+    cache.clear()
+    return posts
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('page', ['', '?page=3'])
+def test_index_num_queries(
+        client, posts_with_comments, django_assert_max_num_queries, page):
+    with django_assert_max_num_queries(MAX_LIST_QUERIES):
+        response = client.get(f'/{page}')
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+def test_category_num_queries(
+        client, posts_with_comments, published_category,
+        django_assert_max_num_queries):
+    with django_assert_max_num_queries(MAX_LIST_QUERIES):
+        response = client.get(f'/category/{published_category.slug}/')
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+def test_profile_num_queries(
+        client, posts_with_comments, user, django_assert_max_num_queries):
+    with django_assert_max_num_queries(MAX_LIST_QUERIES):
+        response = client.get(f'/profile/{user.username}/')
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+def test_post_detail_num_queries(
+        client, posts_with_comments, django_assert_max_num_queries):
+    with django_assert_max_num_queries(MAX_DETAIL_QUERIES):
+        response = client.get(f'/posts/{posts_with_comments[0].id}/')
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+def test_list_comment_count(client, posts_with_comments):
+    response = client.get('/')
+    for post in response.context['page_obj']:
+        assert post.comment_count == post.comments.count(), (
+            'Убедитесь, что количество комментариев на странице '
+            'совпадает с количеством комментариев к публикации.'
+        )